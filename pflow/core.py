@@ -363,6 +363,7 @@ class Graph(Component):
 
     def __init__(self, *args, **kwargs):
         self.components = set()  # Nodes
+        self._components_by_name = {}  # Nodes, keyed by component name
         super(Graph, self).__init__(*args, **kwargs)
 
     @classmethod
@@ -455,8 +456,7 @@ class Graph(Component):
             return component
 
         # Unique name?
-        used_names = utils.pluck(self.components, 'name')
-        if component.name in used_names:
+        if component.name in self._components_by_name:
             raise ValueError('component name "{}" has already been used in '
                              'this graph'.format(component.name))
 
@@ -466,14 +466,14 @@ class Graph(Component):
             component.state = ComponentState.INITIALIZED
 
         self.components.add(component)
+        self._components_by_name[component.name] = component
         return component
 
     def get_component(self, name):
-        for component in self.components:
-            if component.name == name:
-                return component
-
-        raise ValueError('Component name "{}" does not exist in this graph'.format(name))
+        try:
+            return self._components_by_name[name]
+        except KeyError:
+            raise ValueError('Component name "{}" does not exist in this graph'.format(name))
 
     def get_all_components(self, include_graphs=False):
         visited = set()
@@ -517,11 +517,7 @@ class Graph(Component):
             the Component to remove.
         """
         if isinstance(component, basestring):
-            component_name = component
-            for c in self.components:
-                if c.name == component_name:
-                    component = c
-                    break
+            component = self._components_by_name.get(component, component)
 
         if not isinstance(component, Component):
             raise ValueError('component must either be a Component object or '
@@ -534,6 +530,7 @@ class Graph(Component):
             self.disconnect(inport)
 
         self.components.remove(component)
+        del self._components_by_name[component.name]
 
     @assert_component_state(ComponentState.NOT_INITIALIZED)
     def set_initial_packet(self, port, value):
@@ -644,15 +641,24 @@ class Graph(Component):
         Parameters
         ----------
         port : ``port.Port``
-            the port to disconnect.
+            the port to disconnect. Disconnecting a port that isn't connected
+            does nothing.
         """
         if not port.is_connected():
-            if isinstance(port, OutputPort):
-                log.debug('%s disconnected from %s' % (port, port.target_port))
-                port.target_port = None
-            elif isinstance(port, InputPort):
-                log.debug('%s disconnected from %s' % (port, port.source_port))
-                port.source_port = None
+            return
+
+        if isinstance(port, OutputPort):
+            target_port = port.target_port
+            log.debug('%s disconnected from %s', port, target_port)
+            port.target_port = None
+            if target_port is not None and target_port.source_port is port:
+                target_port.source_port = None
+        elif isinstance(port, InputPort):
+            source_port = port.source_port
+            log.debug('%s disconnected from %s', port, source_port)
+            port.source_port = None
+            if source_port is not None and source_port.target_port is port:
+                source_port.target_port = None
 
     @property
     def get_self_starters(self):
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from .executors.single_process import SingleProcessGraphExecutor
+from .version import __version__
 
 import os
 import sys
@@ -11,11 +12,16 @@ from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 import inspect
 import functools
-import textwrap
+
+try:
+    import cPickle as pickle  # 2.x
+except ImportError:
+    import pickle  # 3.x
 
 import argparse
 import requests
 import gevent
+import gevent.socket
 import geventwebsocket
 
 import pflow.components
@@ -29,8 +35,30 @@ class Runtime(object):
     Description of the runtime goes here.
     This will appear in the FlowHub registry description.
     """
+    __slots__ = ('log', '_components', '_specs_cache', '_graphs', '_executors',
+                 'executor_class', 'spec_cache_dir', '_runtime_meta',
+                 '_runtime_message')
+
     PROTOCOL_VERSION = '0.5'
 
+    # Supported protocol capabilities
+    CAPABILITIES = (
+        'protocol:runtime',      # expose the ports of its main graph using the Runtime protocol and transmit
+                                 # packet information to/from them
+
+        'protocol:graph',        # modify its graphs using the Graph protocol
+
+        'protocol:component',    # list and modify its components using the Component protocol
+
+        'protocol:network',      # control and introspect its running networks using the Network protocol
+
+        #'component:setsource',  # compile and run custom components sent as source code strings
+
+        'component:getsource',   # read and send component source code back to client
+
+        'network:persist',       # "flash" a running graph setup into itself, making it persistent across reboots
+    )
+
     # Mapping of native Python types to FBP protocol types
     _type_map = {
         str: 'string',
@@ -50,62 +78,73 @@ class Runtime(object):
         #buffer
     }
 
-    def __init__(self, executor_class=SingleProcessGraphExecutor):
+    def __init__(self, executor_class=SingleProcessGraphExecutor, spec_cache_dir=None):
+        """
+        :param executor_class: the GraphExecutor class used to run graphs.
+        :param spec_cache_dir: directory to persist component specs in between
+                runs, so that unchanged modules don't need to be re-inspected
+                by register_module(). (optional)
+        """
         self.log = logging.getLogger('%s.%s' % (self.__class__.__module__,
                                                 self.__class__.__name__))
 
         self._components = {}  # Component metadata, keyed by component name
+        self._specs_cache = None  # Memoized get_all_component_specs() result
         self._graphs = {}  # Graph instances, keyed by graph ID
         self._executors = {}  # GraphExecutor instances, keyed by graph ID
 
         self.executor_class = executor_class
+        self.spec_cache_dir = spec_cache_dir
 
-        self.log.debug('Initialized runtime!')
-
-    def get_runtime_meta(self):
-        # Supported protocol capabilities
-        capabilities = [
-            'protocol:runtime',      # expose the ports of its main graph using the Runtime protocol and transmit
-                                     # packet information to/from them
-
-            'protocol:graph',        # modify its graphs using the Graph protocol
-
-            'protocol:component',    # list and modify its components using the Component protocol
-
-            'protocol:network',      # control and introspect its running networks using the Network protocol
-
-            #'component:setsource',  # compile and run custom components sent as source code strings
-
-            'component:getsource',   # read and send component source code back to client
-
-            'network:persist',       # "flash" a running graph setup into itself, making it persistent across reboots
-        ]
-
-        all_capabilities = capabilities
-
-        return {
+        # Runtime metadata never changes, so build and serialize it once
+        self._runtime_meta = {
             'label': 'pflow python runtime',
             'type': 'pflow',
             'version': self.PROTOCOL_VERSION,
-            'capabilities': capabilities,
-            'allCapabilities': all_capabilities
+            'capabilities': self.CAPABILITIES,
+            'allCapabilities': self.CAPABILITIES
             #'graph': ''
         }
+        self._runtime_message = json.dumps({'protocol': 'runtime',
+                                            'command': 'runtime',
+                                            'payload': self._runtime_meta})
+
+        self.log.debug('Initialized runtime!')
+
+    def get_runtime_meta(self):
+        return self._runtime_meta
+
+    def get_runtime_message(self):
+        """
+        Returns the pre-serialized ``runtime:runtime`` protocol message.
+        """
+        return self._runtime_message
 
     def get_all_component_specs(self):
-        specs = {}
-        for component_name, component_options in self._components.iteritems():
-            specs[component_name] = component_options['spec']
+        if self._specs_cache is None:
+            self._specs_cache = {component_name: component_options['spec']
+                                 for component_name, component_options in self._components.iteritems()}
+
+        return self._specs_cache
 
-        return specs
+    def get_all_component_messages(self):
+        """
+        Returns the pre-serialized ``component:component`` protocol messages
+        for all registered components.
+        """
+        return [component_options['message']
+                for component_options in self._components.itervalues()]
 
-    def register_component(self, component_class, overwrite=False):
+    def register_component(self, component_class, overwrite=False, metadata=None):
         """
         Registers a component class.
 
         :param component_class: the Component class to register.
         :param overwrite: should the component be overwritten if it already exists?
                 if not, a ValueError will be raised if the component already exists.
+        :param metadata: previously built metadata for this component (e.g. from
+                the spec cache). if not specified, it will be built.
+        :return: the component metadata.
         """
         if not issubclass(component_class, core.Component):
             raise ValueError('component_class must be a class that inherits '
@@ -118,11 +157,35 @@ class Runtime(object):
             raise ValueError("Component {0} already registered".format(
                 long_name))
 
-        self.log.debug('Registering component: {0}'.format(long_name))
+        self.log.debug('Registering component: %s', long_name)
 
-        self._components[long_name] = {
-            'class': component_class,
-            'spec': self._create_component_spec(long_name, component_class)
+        if metadata is None:
+            metadata = self._create_component_metadata(long_name, component_class)
+
+        component_options = dict(metadata)
+        component_options['class'] = component_class
+        self._components[long_name] = component_options
+        self._specs_cache = None
+
+        return metadata
+
+    def _create_component_metadata(self, long_name, component_class):
+        """
+        Builds the picklable metadata that is stored for a registered component.
+        """
+        try:
+            source_code = inspect.getsource(component_class)
+        except (IOError, TypeError):
+            source_code = ''
+
+        spec = self._create_component_spec(long_name, component_class)
+        return {
+            'spec': spec,
+            'source': source_code,
+            # Serialized once here, so listing components doesn't re-encode them
+            'message': json.dumps({'protocol': 'component',
+                                   'command': 'component',
+                                   'payload': spec})
         }
 
     def _long_class_name(self, component_class):
@@ -146,46 +209,112 @@ class Runtime(object):
             raise ValueError('module must be either a module or the name of a '
                              'module')
 
-        self.log.debug('Registering components in module: {}'.format(
-            module.__name__))
-
-        registered = 0
-        for obj_name in dir(module):
-            class_obj = getattr(module, obj_name)
-            if (inspect.isclass(class_obj) and
-                    (class_obj != core.Component) and
-                    (not inspect.isabstract(class_obj)) and
-                    (not issubclass(class_obj, core.Graph)) and
-                    issubclass(class_obj, core.Component)):
-                self.register_component(class_obj, overwrite)
-                registered += 1
-
-        if registered == 0:
+        self.log.debug('Registering components in module: %s', module.__name__)
+
+        component_classes = []
+        for class_obj in vars(module).itervalues():
+            # Cheapest checks first, since most module attributes aren't classes
+            if not isinstance(class_obj, type):
+                continue
+
+            if (class_obj is core.Component or
+                    not issubclass(class_obj, core.Component) or
+                    issubclass(class_obj, core.Graph) or
+                    class_obj.__abstractmethods__):
+                continue
+
+            component_classes.append(class_obj)
+
+        if len(component_classes) == 0:
             self.log.warn('No components were found in module: {}'.format(
                 module.__name__))
+            return
+
+        cache_path = cache_key = None
+        cached_metadata = {}
+        if self.spec_cache_dir is not None:
+            cache_path = os.path.join(self.spec_cache_dir,
+                                      '{}.pickle'.format(module.__name__))
+            cache_key = self._get_spec_cache_key(component_classes)
+            cached_metadata = self._read_spec_cache(cache_path, cache_key)
+
+        all_metadata = {}
+        for class_obj in component_classes:
+            long_name = self._long_class_name(class_obj)
+            all_metadata[long_name] = self.register_component(
+                class_obj, overwrite, metadata=cached_metadata.get(long_name))
+
+        if cache_path is not None and all_metadata != cached_metadata:
+            self._write_spec_cache(cache_path, cache_key, all_metadata)
+
+    def _get_spec_cache_key(self, component_classes):
+        """
+        Cached specs are only valid for the same pflow version and the same
+        source files of the component classes, all of their bases, and this
+        module (which builds the specs).
+        """
+        module_files = {__file__}
+        for component_class in component_classes:
+            for base_class in inspect.getmro(component_class):
+                module_file = getattr(sys.modules.get(base_class.__module__), '__file__', None)
+                if module_file is not None:
+                    module_files.add(module_file)
+
+        return (__version__,
+                tuple(sorted((module_file, os.path.getmtime(module_file))
+                             for module_file in module_files)))
+
+    def _read_spec_cache(self, cache_path, cache_key):
+        # Any failure to read the cache is just treated as a cache miss
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, cached_metadata = pickle.load(f)
+
+            if not all(set(metadata) == {'spec', 'source', 'message'}
+                       for metadata in cached_metadata.itervalues()):
+                raise ValueError('unexpected component metadata')
+        except Exception as ex:
+            self.log.debug('Unable to read spec cache %s: %s', cache_path, ex)
+            return {}
+
+        if cached_key != cache_key:
+            self.log.debug('Spec cache %s is stale', cache_path)
+            return {}
+
+        return cached_metadata
+
+    def _write_spec_cache(self, cache_path, cache_key, all_metadata):
+        cache_dir = os.path.dirname(cache_path)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((cache_key, all_metadata), f, pickle.HIGHEST_PROTOCOL)
+
+            os.rename(tmp_path, cache_path)
+        except (IOError, OSError, pickle.PicklingError, TypeError) as ex:
+            self.log.warn('Unable to write spec cache %s: %s', cache_path, ex)
+
+            # Don't leave partially written caches behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def _create_component_spec(self, component_class_name, component_class):
         if not issubclass(component_class, core.Component):
             raise ValueError('component_class must be a Component')
 
         component = component_class('FAKE_NAME')
-
-        def get_port_type(port, default_type='any'):
-            if len(port.allowed_types) == 0:
-                return default_type
-            elif len(port.allowed_types) == 1:
-                first_type = next(iter(port.allowed_types))
-                mapped_type = self._type_map.get(first_type, default_type)
-                # self.log.warn('Type of %s is %s' % (port, mapped_type))
-                return mapped_type
-            else:
-                self.log.warn('{} has more than 1 allowed type, which is incompatible with FBP protocol. '
-                              'Defaulting to "{}" instead.'.format(port, default_type))
-                return default_type
+        get_port_type = self._get_port_type
+        array_inport_class = core.ArrayInputPort
+        array_outport_class = core.ArrayOutputPort
 
         return {
             'name': component_class_name,
-            'description': textwrap.dedent(component.__doc__ or '').strip(),
+            'description': inspect.cleandoc(component.__doc__ or '').strip(),
             #'icon': '',
             'subgraph': issubclass(component_class, core.Graph),
             'inPorts': [
@@ -193,7 +322,7 @@ class Runtime(object):
                     'id': inport.name,
                     'type': get_port_type(inport),
                     'description': (inport.description or ''),
-                    'addressable': isinstance(inport, core.ArrayInputPort),
+                    'addressable': isinstance(inport, array_inport_class),
                     'required': (not inport.optional),
                     #'values': []
                     'default': inport.default
@@ -205,13 +334,27 @@ class Runtime(object):
                     'id': outport.name,
                     'type': get_port_type(outport),
                     'description': (outport.description or ''),
-                    'addressable': isinstance(outport, core.ArrayOutputPort),
+                    'addressable': isinstance(outport, array_outport_class),
                     'required': (not outport.optional)
                 }
                 for outport in component.outputs
             ]
         }
 
+    def _get_port_type(self, port, default_type='any'):
+        allowed_types = port.allowed_types
+        if not allowed_types:
+            return default_type
+        elif len(allowed_types) == 1:
+            first_type, = allowed_types
+            mapped_type = self._type_map.get(first_type, default_type)
+            # self.log.warn('Type of %s is %s' % (port, mapped_type))
+            return mapped_type
+        else:
+            self.log.warn('{} has more than 1 allowed type, which is incompatible with FBP protocol. '
+                          'Defaulting to "{}" instead.'.format(port, default_type))
+            return default_type
+
     def is_started(self, graph_id):
         if graph_id not in self._executors:
             return False
@@ -222,7 +365,7 @@ class Runtime(object):
         """
         Execute a graph.
         """
-        self.log.debug('Graph {}: Starting execution'.format(graph_id))
+        self.log.debug('Graph %s: Starting execution', graph_id)
 
         graph = self._graphs[graph_id]
 
@@ -246,7 +389,7 @@ class Runtime(object):
         """
         Stop executing a graph.
         """
-        self.log.debug('Graph {}: Stopping execution'.format(graph_id))
+        self.log.debug('Graph %s: Stopping execution', graph_id)
         if graph_id not in self._executors:
             raise ValueError('Invalid graph: {}'.format(graph_id))
 
@@ -272,27 +415,30 @@ class Runtime(object):
         return self._graphs[graph_id]
 
     def _find_component_by_name(self, graph, component_name):
-        for component in graph.components:
-            if component.name == component_name:
-                return component
+        try:
+            return graph.get_component(component_name)
+        except ValueError:
+            return None
 
     def get_source_code(self, component_name):
-        component = None
-        for graph in self._graphs.values():
-            component = self._find_component_by_name(graph, component_name)
-            if component is not None:
-                break
+        """
+        Returns the source code of a registered component, which is captured
+        when the component is registered.
 
-        if component is None:
+        :param component_name: the full (``library/Name``) name of the
+                component class.
+        """
+        component_options = self._components.get(component_name)
+        if component_options is None:
             raise ValueError('No component named {}'.format(component_name))
 
-        return inspect.getsource(component.__class__)
+        return component_options['source']
 
     def new_graph(self, graph_id):
         """
         Create a new graph.
         """
-        self.log.debug('Graph {}: Initializing'.format(graph_id))
+        self.log.debug('Graph %s: Initializing', graph_id)
         self._graphs[graph_id] = core.Graph(graph_id, initialize=False)
 
     def add_node(self, graph_id, node_id, component_id):
@@ -301,8 +447,8 @@ class Runtime(object):
         """
         # Normally you'd instantiate the component here,
         # we just store the name
-        self.log.debug('Graph {}: Adding node {}({})'.format(
-            graph_id, component_id, node_id))
+        self.log.debug('Graph %s: Adding node %s(%s)',
+                       graph_id, component_id, node_id)
 
         graph = self._create_or_get_graph(graph_id)
 
@@ -314,8 +460,7 @@ class Runtime(object):
         """
         Destroy component instance.
         """
-        self.log.debug('Graph {}: Removing node {}'.format(
-            graph_id, node_id))
+        self.log.debug('Graph %s: Removing node %s', graph_id, node_id)
 
         graph = self._create_or_get_graph(graph_id)
         graph.remove_component(node_id)
@@ -324,8 +469,8 @@ class Runtime(object):
         """
         Connect ports between components.
         """
-        self.log.debug('Graph {}: Connecting ports: {} -> {}'.format(
-            graph_id, src, tgt))
+        self.log.debug('Graph %s: Connecting ports: %s -> %s',
+                       graph_id, src, tgt)
 
         graph = self._graphs[graph_id]
 
@@ -341,33 +486,37 @@ class Runtime(object):
         """
         Disconnect ports between components.
         """
-        self.log.debug('Graph {}: Disconnecting ports: {} -> {}'.format(
-            graph_id, src, tgt))
+        self.log.debug('Graph %s: Disconnecting ports: %s -> %s',
+                       graph_id, src, tgt)
 
         graph = self._graphs[graph_id]
 
         source_component = self._find_component_by_name(graph, src['node'])
         source_port = source_component.outputs[src['port']]
-        if source_port.is_connected():
-            graph.disconnect(source_port)
+        graph.disconnect(source_port)
 
         target_component = self._find_component_by_name(graph, tgt['node'])
         target_port = target_component.inputs[tgt['port']]
-        if target_port.is_connected():
-            graph.disconnect(target_port)
+        graph.disconnect(target_port)
 
     def add_iip(self, graph_id, src, data):
         """
         Set the inital packet for a component inport.
         """
-        self.log.info('Graph {}: Setting IIP to {!r} on port {}'.format(
-            graph_id, data, src))
+        self.log.info('Graph %s: Setting IIP to %r on port %s',
+                      graph_id, data, src)
 
         graph = self._graphs[graph_id]
 
         target_component = self._find_component_by_name(graph, src['node'])
         target_port = target_component.inputs[src['port']]
-        if target_port.is_connected():
+
+        # Replace an existing IIP, rather than leaving its generator behind
+        source_port = target_port.source_port
+        if (source_port is not None and
+                isinstance(source_port.component, core.InitialPacketGenerator)):
+            graph.unset_initial_packet(target_port)
+        else:
             graph.disconnect(target_port)
 
         graph.set_initial_packet(target_port, data)
@@ -376,16 +525,12 @@ class Runtime(object):
         """
         Remove the initial packet for a component inport.
         """
-        self.log.debug('Graph {}: Removing IIP from port {}'.format(
-            graph_id, src))
+        self.log.debug('Graph %s: Removing IIP from port %s', graph_id, src)
 
         graph = self._graphs[graph_id]
 
         target_component = self._find_component_by_name(graph, src['node'])
         target_port = target_component.inputs[src['port']]
-        if target_port.is_connected():
-            graph.disconnect(target_port)
-
         graph.unset_initial_packet(target_port)
 
 
@@ -394,8 +539,19 @@ def create_websocket_application(runtime):
         """
         Web socket application that hosts a single Runtime.
         """
+        # Handler method names, keyed by FBP sub-protocol
+        _PROTOCOL_DISPATCH = {
+            'runtime': 'handle_runtime',
+            'component': 'handle_component',
+            'graph': 'handle_graph',
+            'network': 'handle_network'
+        }
+
+        # Serialized message envelopes (up to the payload), keyed by (protocol, command)
+        _envelope_prefixes = {}
+
         def __init__(self, ws):
-            super(WebSocketRuntimeAdapterApplication, self).__init__(self)
+            super(WebSocketRuntimeAdapterApplication, self).__init__(ws)
 
             self.log = logging.getLogger('%s.%s' % (self.__class__.__module__,
                                                     self.__class__.__name__))
@@ -420,42 +576,61 @@ def create_websocket_application(runtime):
             self.log.info("Connection closed. Reason: %s" % reason)
 
         def on_message(self, message, **kwargs):
-            self.log.debug('MESSAGE: %s' % message)
+            log = self.log
 
             if not message:
-                self.log.warn('Got empty message')
+                log.warn('Got empty message')
                 return
 
-            m = json.loads(message)
-            dispatch = {
-                'runtime': self.handle_runtime,
-                'component': self.handle_component,
-                'graph': self.handle_graph,
-                'network': self.handle_network
-            }
+            log.debug('MESSAGE: %s', message)
 
-            try:
-                handler = dispatch[m.get('protocol')]
-            except KeyError:
-                self.log.warn("Subprotocol '{}' not supported".format(p))
+            m = json.loads(message)
+            protocol = m.get('protocol')
+            handler_name = self._PROTOCOL_DISPATCH.get(protocol)
+            if handler_name is None:
+                log.warn("Subprotocol '%s' not supported", protocol)
             else:
-                handler(m['command'], m['payload'])
+                getattr(self, handler_name)(m['command'], m['payload'])
 
         def send(self, protocol, command, payload):
             """
             Send a message to UI/client
             """
-            self.ws.send(json.dumps({'protocol': protocol,
-                                     'command': command,
-                                     'payload': payload}))
+            self.ws.send(self.encode_message(protocol, command, payload))
+
+        @classmethod
+        def encode_message(cls, protocol, command, payload):
+            """
+            Serialize a message, reusing the already serialized envelope for
+            the protocol and command so that only the payload gets encoded.
+            """
+            try:
+                prefix = cls._envelope_prefixes[protocol, command]
+            except KeyError:
+                prefix = cls._envelope_prefixes[protocol, command] = (
+                    '{"protocol":%s,"command":%s,"payload":' % (json.dumps(protocol),
+                                                               json.dumps(command)))
+
+            return prefix + json.dumps(payload) + '}'
+
+        def send_many(self, messages):
+            """
+            Send several pre-serialized messages to UI/client.
+
+            The NoFlo protocol expects a single message per frame, so rather than
+            batching them into one frame, the socket is corked until all of the
+            frames have been written.
+            """
+            handler = getattr(self.ws, 'handler', None)
+            with utils.corked_socket(getattr(handler, 'socket', None)):
+                for message in messages:
+                    self.ws.send(message)
 
         ### Protocol send/responses ###
         def handle_runtime(self, command, payload):
             # Absolute minimum: be able to tell UI info about runtime and supported capabilities
             if command == 'getruntime':
-                payload = self.runtime.get_runtime_meta()
-                # self.log.debug(json.dumps(payload, indent=4))
-                self.send('runtime', 'runtime', payload)
+                self.ws.send(self.runtime.get_runtime_message())
 
             # network:packet, allows sending data in/out to networks in this runtime
             # can be used to represent the runtime as a FBP component in bigger system "remote subgraph"
@@ -471,12 +646,9 @@ def create_websocket_application(runtime):
             # Practical minimum: be able to tell UI which components are available
             # This allows them to be listed, added, removed and connected together in the UI
             if command == 'list':
-                specs = self.runtime.get_all_component_specs()
-                for component_name, component_data in specs.iteritems():
-                    payload = component_data
-                    self.send('component', 'component', payload)
-
-                self.send('component', 'componentsready', None)
+                messages = self.runtime.get_all_component_messages()
+                messages.append(self.encode_message('component', 'componentsready', None))
+                self.send_many(messages)
             # Get source code for component
             elif command == 'getsource':
                 component_name = payload['name']
@@ -547,9 +719,9 @@ def create_websocket_application(runtime):
                 # for this example, we consider ourselves running as long as we have been started
                 running = started
                 payload = {
-                    graph: g,
-                    started: started,
-                    running: running,
+                    'graph': g,
+                    'started': started,
+                    'running': running,
                 }
                 self.send('network', cmd, payload)
 
@@ -561,7 +733,7 @@ def create_websocket_application(runtime):
                 send_status('started', graph)
             elif command == 'stop':
                 self.runtime.stop(graph)
-                send_status('started', graph)
+                send_status('stopped', graph)
             else:
                 self.log.warn("Unknown command '%s' for protocol '%s'" % (command, 'network'))
 
@@ -607,6 +779,10 @@ class FlowhubRegistry(RuntimeRegistry):
 
         self._endpoint = 'http://api.flowhub.io'
 
+        # Reuse a single keep-alive connection for registration and pings
+        self._session = requests.Session()
+        self._session.headers['Content-type'] = 'application/json'
+
     def register_runtime(self, runtime, runtime_id, user_id, address):
         if not isinstance(runtime, Runtime):
             raise ValueError('runtime must be a Runtime instance')
@@ -626,14 +802,13 @@ class FlowhubRegistry(RuntimeRegistry):
         }
 
         self.log.info('Registering runtime %s for user %s...' % (runtime_id, user_id))
-        response = requests.put('%s/runtimes/%s' % (self._endpoint, runtime_id),
-                                data=json.dumps(payload),
-                                headers={'Content-type': 'application/json'})
+        response = self._session.put('%s/runtimes/%s' % (self._endpoint, runtime_id),
+                                     data=json.dumps(payload))
         self._ensure_http_success(response)
 
     def ping_runtime(self, runtime_id):
         self.log.info('Pinging runtime %s...' % runtime_id)
-        response = requests.post('%s/runtimes/%s' % (self._endpoint, runtime_id))
+        response = self._session.post('%s/runtimes/%s' % (self._endpoint, runtime_id))
         self._ensure_http_success(response)
 
     @classmethod
@@ -647,11 +822,33 @@ def create_runtime_id(user_id, address):
     return str(uuid.uuid3(uuid.UUID(user_id), 'pflow_' + address))
 
 
+def create_listener(address, backlog=1024, reuse_port=False):
+    """
+    Creates a listening TCP socket for the websocket server.
+
+    :param address: (host, port) tuple to bind to.
+    :param backlog: maximum number of pending connections.
+    :param reuse_port: allow other processes to listen on the same port, so
+            that connections are balanced between several runtimes.
+    """
+    sck = gevent.socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sck.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        if not hasattr(socket, 'SO_REUSEPORT'):
+            raise ValueError('SO_REUSEPORT is not supported on this platform')
+        sck.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+    sck.bind(address)
+    sck.listen(backlog)
+    return sck
+
+
 def main():
     # Argument defaults
     defaults = {
         'host': 'localhost',
-        'port': 3569
+        'port': 3569,
+        'cache_dir': os.path.join(os.path.expanduser('~'), '.cache', 'pflow')
     }
 
     # Parse arguments
@@ -670,6 +867,12 @@ def main():
     argp.add_argument(
         '--port', type=int, default=3569, metavar='PORT',
         help='Listen port for websocket (default: %(port)d)' % defaults)
+    argp.add_argument(
+        '--reuse-port', action='store_true',
+        help='Allow several runtime processes to share the listen port')
+    argp.add_argument(
+        '--cache-dir', default=defaults['cache_dir'], metavar='DIR_PATH',
+        help='Directory to cache component specs in (default: %(cache_dir)s)' % defaults)
     argp.add_argument(
         '--log-file', metavar='FILE_PATH',
         help='File to send log output to (default: none)')
@@ -701,7 +904,7 @@ def main():
         log.warn('No runtime ID was specified, so one was '
                  'generated: {}'.format(runtime_id))
 
-    runtime = Runtime()
+    runtime = Runtime(spec_cache_dir=args.cache_dir)
     runtime.register_module(pflow.components)
 
     def runtime_application_task():
@@ -710,7 +913,8 @@ def main():
         that inspect/manipulate the Runtime.
         """
         r = geventwebsocket.Resource(OrderedDict([('/', create_websocket_application(runtime))]))
-        s = geventwebsocket.WebSocketServer(('', args.port), r)
+        listener = create_listener(('', args.port), reuse_port=args.reuse_port)
+        s = geventwebsocket.WebSocketServer(listener, r)
         s.serve_forever()
 
     def registration_task():
@@ -5,6 +5,8 @@ except ImportError:
     import mock
 
 from . import helpers
+from ..core import Graph
+from ..components import Repeat
 
 
 class ComponentTest(unittest.TestCase):
@@ -64,13 +66,21 @@ class GraphTest(unittest.TestCase):
     def test_is_upstream_terminated(self):
         pass
 
-    @unittest.skip('unimplemented')
     def test_add_component(self):
-        pass
+        graph = Graph('GRAPH', initialize=False)
+        component = graph.add_component(Repeat('RPT'))
+
+        self.assertIn(component, graph.components)
+        self.assertIs(graph.get_component('RPT'), component)
+        self.assertRaises(ValueError, graph.add_component, Repeat('RPT'))
 
-    @unittest.skip('unimplemented')
     def test_remove_component(self):
-        pass
+        graph = Graph('GRAPH', initialize=False)
+        graph.add_component(Repeat('RPT'))
+        graph.remove_component('RPT')
+
+        self.assertEqual(len(graph.components), 0)
+        self.assertRaises(ValueError, graph.get_component, 'RPT')
 
     @unittest.skip('unimplemented')
     def test_set_initial_packet(self):
@@ -88,9 +98,19 @@ class GraphTest(unittest.TestCase):
     def test_connect(self):
         pass
 
-    @unittest.skip('unimplemented')
     def test_disconnect(self):
-        pass
+        graph = Graph('GRAPH', initialize=False)
+        source_port = graph.add_component(Repeat('RPT_1')).outputs['OUT']
+        target_port = graph.add_component(Repeat('RPT_2')).inputs['IN']
+        graph.connect(source_port, target_port)
+
+        graph.disconnect(target_port)
+        self.assertFalse(source_port.is_connected())
+        self.assertFalse(target_port.is_connected())
+
+        # Disconnecting an already disconnected port is a no-op
+        graph.disconnect(target_port)
+        self.assertFalse(target_port.is_connected())
 
     @unittest.skip('unimplemented')
     def test_self_starters(self):
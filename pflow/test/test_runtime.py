@@ -1,22 +1,91 @@
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 try:
     from unittest import mock
 except ImportError:
     import mock
 
+from ..runtime import Runtime
+from .. import components, core
+
 
 class RuntimeTest(unittest.TestCase):
-    @unittest.skip('unimplemented')
     def test_all_component_specs(self):
-        pass
+        runtime = Runtime()
+        runtime.register_component(components.Repeat)
+
+        specs = runtime.get_all_component_specs()
+        self.assertEqual(specs.keys(), ['pflow.components/Repeat'])
+        self.assertIs(specs, runtime.get_all_component_specs())
+
+        # Registering invalidates the cache
+        runtime.register_component(components.Drop)
+        self.assertEqual(sorted(runtime.get_all_component_specs().keys()),
+                         ['pflow.components/Drop', 'pflow.components/Repeat'])
 
     @unittest.skip('unimplemented')
     def test_register_component(self):
         pass
 
-    @unittest.skip('unimplemented')
+    def test_get_source_code(self):
+        runtime = Runtime()
+        runtime.register_component(components.Repeat)
+
+        source_code = runtime.get_source_code('pflow.components/Repeat')
+        self.assertTrue(source_code.startswith('class Repeat('))
+        self.assertRaises(ValueError, runtime.get_source_code, 'Repeat')
+        self.assertRaises(ValueError, runtime.get_source_code, 'pflow.components/Missing')
+
     def test_register_module(self):
-        pass
+        runtime = Runtime()
+        runtime.register_module(components)
+
+        specs = runtime.get_all_component_specs()
+        self.assertIn('pflow.components/Repeat', specs)
+        self.assertNotIn('pflow.core/Component', specs)
+
+    def test_register_module_spec_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+
+        runtime = Runtime(spec_cache_dir=cache_dir)
+        runtime.register_module(components)
+        self.assertTrue(os.path.exists(os.path.join(cache_dir, 'pflow.components.pickle')))
+
+        # Specs should be loaded from the cache instead of being rebuilt
+        cached_runtime = Runtime(spec_cache_dir=cache_dir)
+        with mock.patch.object(Runtime, '_create_component_spec') as create_spec:
+            cached_runtime.register_module(components)
+            self.assertFalse(create_spec.called)
+
+        self.assertEqual(cached_runtime.get_all_component_specs(),
+                         runtime.get_all_component_specs())
+
+    def test_register_module_corrupt_spec_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_path = os.path.join(cache_dir, 'pflow.components.pickle')
+
+        expected_specs = Runtime()
+        expected_specs.register_module(components)
+
+        corrupt_caches = [
+            pickle.dumps(5),
+            b'cnonexistent_module\nmissing\n.',  # Reference to a missing global
+            b'not a pickle'
+        ]
+        for corrupt_cache in corrupt_caches:
+            with open(cache_path, 'wb') as f:
+                f.write(corrupt_cache)
+
+            # Corrupt caches should just be a cache miss
+            runtime = Runtime(spec_cache_dir=cache_dir)
+            runtime.register_module(components)
+            self.assertEqual(runtime.get_all_component_specs(),
+                             expected_specs.get_all_component_specs())
 
     @unittest.skip('unimplemented')
     def test_is_started(self):
@@ -50,13 +119,44 @@ class RuntimeTest(unittest.TestCase):
     def test_remove_edge(self):
         pass
 
-    @unittest.skip('unimplemented')
+    def _create_iip_graph(self):
+        runtime = Runtime()
+        runtime.register_component(components.Repeat)
+        runtime.new_graph('GRAPH')
+        runtime.add_node('GRAPH', 'RPT', 'pflow.components/Repeat')
+        return runtime, runtime._graphs['GRAPH']
+
+    def _get_iip_generators(self, graph):
+        return [component for component in graph.components
+                if isinstance(component, core.InitialPacketGenerator)]
+
     def test_add_iip(self):
-        pass
+        runtime, graph = self._create_iip_graph()
+        target_port = graph.get_component('RPT').inputs['IN']
+
+        runtime.add_iip('GRAPH', {'node': 'RPT', 'port': 'IN'}, 42)
+        iip_gens = self._get_iip_generators(graph)
+        self.assertEqual(len(iip_gens), 1)
+        self.assertEqual(iip_gens[0].value, 42)
+        self.assertIs(target_port.source_port.component, iip_gens[0])
+
+        # Replacing the IIP should remove the old generator
+        runtime.add_iip('GRAPH', {'node': 'RPT', 'port': 'IN'}, 43)
+        iip_gens = self._get_iip_generators(graph)
+        self.assertEqual(len(iip_gens), 1)
+        self.assertEqual(iip_gens[0].value, 43)
+        self.assertIs(target_port.source_port.component, iip_gens[0])
 
-    @unittest.skip('unimplemented')
     def test_remove_iip(self):
-        pass
+        runtime, graph = self._create_iip_graph()
+        target_port = graph.get_component('RPT').inputs['IN']
+
+        runtime.add_iip('GRAPH', {'node': 'RPT', 'port': 'IN'}, 42)
+        runtime.add_iip('GRAPH', {'node': 'RPT', 'port': 'IN'}, 43)
+        runtime.remove_iip('GRAPH', {'node': 'RPT', 'port': 'IN'})
+
+        self.assertEqual(self._get_iip_generators(graph), [])
+        self.assertFalse(target_port.is_connected())
 
 
 class FlowhubRegistryTest(unittest.TestCase):
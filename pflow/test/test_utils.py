@@ -4,12 +4,29 @@ try:
 except ImportError:
     import mock
 
+import socket
+
+from .. import utils
+
 
 class UtilsTest(unittest.TestCase):
     @unittest.skip('unimplemented')
     def test_get_free_tcp_port(self):
         pass
 
+    def test_corked_socket(self):
+        sck = mock.Mock()
+        with utils.corked_socket(sck) as corked:
+            self.assertIs(corked, sck)
+
+        if hasattr(socket, 'TCP_CORK'):
+            sck.setsockopt.assert_has_calls([
+                mock.call(socket.IPPROTO_TCP, socket.TCP_CORK, 1),
+                mock.call(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+            ])
+        else:
+            self.assertFalse(sck.setsockopt.called)
+
     @unittest.skip('unimplemented')
     def test_random_id(self):
         pass
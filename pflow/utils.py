@@ -1,5 +1,6 @@
 import uuid
 import socket
+import contextlib
 
 
 def get_free_tcp_port():
@@ -16,6 +17,28 @@ def get_free_tcp_port():
     return port
 
 
+@contextlib.contextmanager
+def corked_socket(sck):
+    """
+    Context manager that holds back partial frames written to a TCP socket
+    until the block exits, so that many small writes go out as few segments.
+
+    This is a no-op on platforms that don't support TCP_CORK.
+
+    :param sck: the connected TCP socket to cork.
+    """
+    cork = getattr(socket, 'TCP_CORK', None)
+    if cork is None or sck is None:
+        yield sck
+        return
+
+    sck.setsockopt(socket.IPPROTO_TCP, cork, 1)
+    try:
+        yield sck
+    finally:
+        sck.setsockopt(socket.IPPROTO_TCP, cork, 0)
+
+
 def random_id():
     """
     Generates a random hex string ID value.
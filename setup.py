@@ -20,6 +20,13 @@ install_requires = [
     'pymongo'
 ]
 
+# Optional dependencies: C accelerators for the fbp network runtime
+extras_require = {
+    'speedups': [
+        'wsaccel',  # websocket utf-8 validation
+    ]
+}
+
 # Test dependencies
 test_requires = [
 ]
@@ -53,6 +60,7 @@ setup(
     ],
 
     install_requires=install_requires,
+    extras_require=extras_require,
 
     test_suite=module_name,
     tests_require=test_requires